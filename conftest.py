@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration for AI Band Backend
+Created by Sergie Code
+
+Warms the detector and generator once per session so the first
+collected test does not pay module-import and first-call costs.
+"""
+
+import pytest
+
+from src.chord_detection import ChordDetector
+from src.midi_generator import MidiGenerator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_components():
+    """Exercise the main code paths once before any test runs."""
+    progression = [{"chord": "C", "start_time": 0.0, "duration": 1.0}]
+
+    detector = ChordDetector()
+    detector.analyze_chord_progression(progression)
+
+    generator = MidiGenerator()
+    generator.generate_bass_track(progression)
+    generator.generate_drum_track(progression, duration=1.0)
+
+    yield
@@ -0,0 +1,13 @@
+"""
+AI Band Backend Package
+Part of AI Band Backend by Sergie Code
+
+Makes the backend importable as a package (from src.chord_detection
+import ChordDetector) so callers no longer need to mutate sys.path.
+The main components are re-exported here for convenience.
+"""
+
+from .chord_detection import ChordDetector, ChordProgressionArrays
+from .midi_generator import MidiGenerator
+
+__all__ = ["ChordDetector", "ChordProgressionArrays", "MidiGenerator"]
@@ -7,8 +7,163 @@ Currently implements basic chord analysis, with placeholders for
 real-time audio processing and AI-based chord recognition.
 """
 
+import math
+import sys
+
 import numpy as np
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple
+
+__all__ = ["ChordDetector", "ChordProgressionArrays"]
+
+try:
+    # Optional JIT acceleration for the integer kernels below. Without
+    # numba the kernels run as plain Python, which is fine for the short
+    # progressions used in the examples and tests.
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+# Integer ids for the chords the feature extractor understands.
+# Unknown chords map to 0 ("C"), matching the previous dict default.
+_CHORD_TYPE_IDS = {"C": 0, "Am": 1, "F": 2, "G": 3, "Dm": 4, "Em": 5}
+
+# Fixed AI feature-vector layout: [chord count, tempo, 8 chord-id
+# slots]. Shared by the one-shot and streaming extractors so buffer
+# sizes cannot drift apart.
+_FEATURE_LENGTH = 10
+
+# Tempo-model assumptions shared by every estimation path: 4/4 time
+# with one chord per measure, and 120 BPM when a progression is too
+# short or malformed to estimate from.
+_BEATS_PER_CHORD = 4
+_DEFAULT_BPM = 120
+
+# Pitch classes for every supported root spelling
+_NOTE_PITCH_CLASSES = {
+    'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3, 'E': 4, 'F': 5,
+    'F#': 6, 'Gb': 6, 'G': 7, 'G#': 8, 'Ab': 8, 'A': 9, 'A#': 10,
+    'Bb': 10, 'B': 11,
+}
+
+# Triad qualities: suffix -> (quality id, semitone intervals from root)
+_CHORD_QUALITIES = {
+    '': (0, (0, 4, 7)),   # major
+    'm': (1, (0, 3, 7)),  # minor
+}
+
+
+def _build_chord_table() -> Dict[str, Tuple[int, int, int]]:
+    """
+    Enumerate root x quality chord names into a lookup table.
+
+    Each entry maps a chord name (e.g. "C", "Am", "Bb") to a tuple of
+    (root pitch class, quality id, 12-bit pitch-class bitmap). Building
+    this once at import replaces per-call string parsing with a single
+    dict lookup.
+    """
+    table = {}
+    for root_name, root_pc in _NOTE_PITCH_CLASSES.items():
+        for suffix, (quality_id, intervals) in _CHORD_QUALITIES.items():
+            pitch_mask = 0
+            for interval in intervals:
+                pitch_mask |= 1 << ((root_pc + interval) % 12)
+            table[root_name + suffix] = (root_pc, quality_id, pitch_mask)
+    return table
+
+
+_CHORD_TABLE = _build_chord_table()
+
+
+@njit(cache=True)
+def _score_keys(vote_ids: np.ndarray, vote_matrix: np.ndarray) -> np.ndarray:
+    """Accumulate key votes for a sequence of chord vote-row ids."""
+    scores = np.zeros(vote_matrix.shape[1], dtype=np.int64)
+    for i in range(vote_ids.shape[0]):
+        row = vote_ids[i]
+        for key in range(vote_matrix.shape[1]):
+            scores[key] += vote_matrix[row, key]
+    return scores
+
+
+if not _HAVE_NUMBA:
+    # Without the JIT the explicit loop above would run interpreted;
+    # gather the vote rows and reduce them in C instead.
+    def _score_keys(vote_ids: np.ndarray, vote_matrix: np.ndarray) -> np.ndarray:  # noqa: F811
+        """Accumulate key votes with a vectorized row-gather and sum."""
+        return vote_matrix[vote_ids].sum(axis=0)
+
+
+class ChordProgressionArrays:
+    """
+    Structure-of-arrays view of a chord progression.
+
+    Stores the progression as three contiguous NumPy columns instead of
+    a list of per-chord dicts, so analysis code can stream each field
+    without chasing dict pointers per element. Missing or invalid
+    fields become id 0, start 0.0 and duration 0.0.
+    """
+
+    __slots__ = ("chord_ids", "start_times", "durations")
+
+    def __init__(self, chord_ids: np.ndarray, start_times: np.ndarray,
+                 durations: np.ndarray):
+        self.chord_ids = chord_ids
+        self.start_times = start_times
+        self.durations = durations
+
+    def __len__(self):
+        return int(self.chord_ids.shape[0])
+
+    def unique_chord_count(self) -> int:
+        """
+        Count distinct chord ids with a compiled np.unique pass.
+
+        Note:
+            This counts ids, not names: chords outside the known table
+            all share id 0, so progressions full of exotic chords
+            should be counted at the name level instead (as
+            analyze_chord_progression does).
+        """
+        if self.chord_ids.size == 0:
+            return 0
+        return int(np.unique(self.chord_ids).size)
+
+    @classmethod
+    def from_dicts(cls, chord_progression: List[Dict[str, Any]]
+                   ) -> "ChordProgressionArrays":
+        """Build the SoA columns from a list of chord dictionaries."""
+        count = len(chord_progression)
+
+        chord_ids = np.fromiter(
+            (_CHORD_TYPE_IDS.get(chord.get("chord"), 0)
+             for chord in chord_progression),
+            dtype=np.int32, count=count
+        )
+        start_times = np.fromiter(
+            (chord.get("start_time", 0.0) if isinstance(
+                chord.get("start_time"), (int, float)) else 0.0
+             for chord in chord_progression),
+            dtype=np.float64, count=count
+        )
+        durations = np.fromiter(
+            (chord.get("duration", 0.0) if isinstance(
+                chord.get("duration"), (int, float)) else 0.0
+             for chord in chord_progression),
+            dtype=np.float64, count=count
+        )
+
+        return cls(chord_ids, start_times, durations)
 
 
 class ChordDetector:
@@ -21,22 +176,80 @@ class ChordDetector:
     - Determine musical key from chord sequences
     - Extract musical features for AI model input
     """
-    
+
+    __slots__ = (
+        "sample_rate", "hop_length", "frame_length",
+        "_analysis_cache", "_analysis_cache_size", "_feature_scratch",
+        "_common_bpms", "chord_key_map",
+        "_key_names", "_key_index", "_vote_ids", "_unknown_vote_id",
+        "_key_votes", "_vote_key_order",
+    )
+
     def __init__(self):
         """Initialize the chord detector with default settings."""
         self.sample_rate = 44100
         self.hop_length = 512
         self.frame_length = 2048
+
+        # Bounded memo of analyze_chord_progression results keyed by a
+        # fingerprint of the progression contents. Callers that ask for
+        # several views of the same progression (tempo, key, features)
+        # only pay for the traversal once.
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_size = 128
+
+        # Scratch buffer reused by extract_features_streaming so
+        # per-beat feature extraction allocates nothing
+        self._feature_scratch = np.zeros(_FEATURE_LENGTH, dtype=np.float32)
+
+        # Common BPM values detect_tempo snaps to, as an array so the
+        # snap is a single vectorized argmin
+        self._common_bpms = np.array(
+            [60, 70, 80, 90, 100, 110, 120, 130, 140, 150, 160],
+            dtype=np.int64
+        )
         
-        # Common chord-to-key mappings
+        # Common chord-to-key mappings (tuples: iterated often, never
+        # mutated)
         self.chord_key_map = {
-            'C': ['C', 'F', 'G'],
-            'Am': ['C', 'F', 'G'],
-            'F': ['F', 'Bb', 'C'],
-            'G': ['C', 'G', 'D'],
-            'Dm': ['F', 'Bb', 'C'],
-            'Em': ['C', 'G', 'D'],
+            'C': ('C', 'F', 'G'),
+            'Am': ('C', 'F', 'G'),
+            'F': ('F', 'Bb', 'C'),
+            'G': ('C', 'G', 'D'),
+            'Dm': ('F', 'Bb', 'C'),
+            'Em': ('C', 'G', 'D'),
         }
+
+        # Precomputed voting table for detect_key: one row per known
+        # chord plus a trailing all-zero row for unknown chords, one
+        # column per candidate key. Built once so key detection reduces
+        # to an integer score accumulation over the table.
+        self._key_names = []
+        for keys in self.chord_key_map.values():
+            for key in keys:
+                if key not in self._key_names:
+                    self._key_names.append(key)
+
+        self._key_index = {name: i for i, name in enumerate(self._key_names)}
+        self._vote_ids = {name: i for i, name in enumerate(self.chord_key_map)}
+        self._unknown_vote_id = len(self.chord_key_map)
+
+        self._key_votes = np.zeros(
+            (len(self.chord_key_map) + 1, len(self._key_names)),
+            dtype=np.int64
+        )
+        for row, keys in enumerate(self.chord_key_map.values()):
+            for key in keys:
+                self._key_votes[row, self._key_index[key]] = 1
+
+        # Key indices each vote row touches, in chord_key_map tuple
+        # order, with an empty row for unknown chords. Used to break
+        # score ties the way the original dict scan did: by which key
+        # was voted for first
+        self._vote_key_order = tuple(
+            tuple(self._key_index[key] for key in keys)
+            for keys in self.chord_key_map.values()
+        ) + ((),)
     
     def detect_chords_from_audio(self, audio_file_path: str) -> List[Dict[str, Any]]:
         """
@@ -76,30 +289,49 @@ class ChordDetector:
         Returns:
             Detected tempo in BPM
         """
+        cached = self._cached_analysis(chord_progression)
+        if cached is not None:
+            return cached["tempo"]
+
         if len(chord_progression) < 2:
-            return 120  # Default tempo
-        
-        # Calculate average chord duration, handling missing keys
-        durations = []
-        for chord in chord_progression:
-            if "duration" in chord and isinstance(chord["duration"], (int, float)):
-                if chord["duration"] > 0:  # Only positive durations
-                    durations.append(chord["duration"])
-        
-        if not durations:
-            return 120  # Default if no valid durations
-        
-        avg_duration = sum(durations) / len(durations)
-        
+            return _DEFAULT_BPM
+
+        # Extract valid positive durations into a contiguous array,
+        # then reduce in C instead of looping in the interpreter
+        durations = np.fromiter(
+            (chord["duration"] for chord in chord_progression
+             if isinstance(chord.get("duration"), (int, float))
+             and chord["duration"] > 0),
+            dtype=np.float64
+        )
+
+        return self._tempo_from_durations(durations)
+
+    def _tempo_from_durations(self, durations: np.ndarray) -> int:
+        """Estimate and snap the tempo from an array of valid durations."""
+        if durations.size == 0:
+            return _DEFAULT_BPM  # Default if no valid durations
+
+        avg_duration = durations.mean()
+
         # Estimate BPM based on chord changes
         # Assuming each chord represents a measure or half-measure
-        beats_per_chord = 4  # Assume 4/4 time signature
-        chord_duration_minutes = avg_duration / 60
-        bpm = beats_per_chord / chord_duration_minutes
-        
-        # Round to common BPM values
-        common_bpms = [60, 70, 80, 90, 100, 110, 120, 130, 140, 150, 160]
-        return min(common_bpms, key=lambda x: abs(x - bpm))
+        bpm = _BEATS_PER_CHORD * 60.0 / avg_duration
+
+        return self._snap_bpm(bpm)
+
+    def _snap_bpm(self, bpm: float) -> int:
+        """
+        Snap a raw BPM estimate to the common 10-BPM grid.
+
+        The grid is uniform, so the snap is plain arithmetic — round to
+        the nearest multiple of 10 and clamp to the table bounds —
+        instead of a distance scan over the table. Exact-halfway
+        estimates take the lower neighbor, as the scan's min() did.
+        """
+        low = int(self._common_bpms[0])
+        high = int(self._common_bpms[-1])
+        return int(max(low, min(high, math.ceil(bpm / 10.0 - 0.5) * 10)))
     
     def detect_key(self, chord_progression: List[Dict[str, Any]]) -> str:
         """
@@ -113,7 +345,11 @@ class ChordDetector:
         """
         if not chord_progression:
             return "C"
-        
+
+        cached = self._cached_analysis(chord_progression)
+        if cached is not None:
+            return cached["key"]
+
         # Extract chord names, handling missing keys
         chords = []
         for chord_info in chord_progression:
@@ -122,79 +358,354 @@ class ChordDetector:
         
         if not chords:
             return "C"  # Default if no valid chords
-        
-        # Simple key detection based on chord frequency
-        key_scores = {}
-        
-        for chord in chords:
-            if chord in self.chord_key_map:
-                for possible_key in self.chord_key_map[chord]:
-                    key_scores[possible_key] = key_scores.get(possible_key, 0) + 1
-        
-        if not key_scores:
+
+        # Simple key detection based on chord frequency: map each chord
+        # to its vote row and accumulate scores through the kernel
+        vote_ids = np.fromiter(
+            (self._vote_ids.get(chord, self._unknown_vote_id)
+             for chord in chords),
+            dtype=np.int64, count=len(chords)
+        )
+        return self._key_from_votes(vote_ids)
+
+    def _key_from_votes(self, vote_ids: np.ndarray) -> str:
+        """
+        Pick the highest-scoring key from an array of vote-row ids.
+
+        Ties between equal scores go to the key that received its first
+        vote earliest in the progression, reproducing the insertion-
+        order behavior of the dict scan this replaced.
+        """
+        if vote_ids.size == 0:
             return "C"
-        
-        # Return the key with highest score
-        return max(key_scores, key=key_scores.get)
+
+        scores = _score_keys(vote_ids, self._key_votes)
+
+        best = scores.max()
+        if best == 0:
+            return "C"
+
+        candidates = np.flatnonzero(scores == best)
+        if candidates.size == 1:
+            return self._key_names[int(candidates[0])]
+
+        # Replay the votes in order and return the first tied key to
+        # receive one
+        tied = {int(candidate) for candidate in candidates}
+        for row in vote_ids:
+            for key_idx in self._vote_key_order[row]:
+                if key_idx in tied:
+                    return self._key_names[key_idx]
+        return "C"
     
-    def analyze_chord_progression(self, chord_progression: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def parse_chord(self, chord_name: str) -> Tuple[int, int, int]:
+        """
+        Parse a chord name into its precomputed components.
+
+        Args:
+            chord_name: Chord name such as "C", "Am" or "Bb"
+
+        Returns:
+            Tuple of (root pitch class, quality id, 12-bit pitch-class
+            bitmap). Unknown chord names fall back to C major, matching
+            the defaults used elsewhere in the detector.
+        """
+        return _CHORD_TABLE.get(chord_name, _CHORD_TABLE['C'])
+
+    def chords_to_pitch_masks(self, chord_progression: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Encode a chord progression as packed pitch-class bitmaps.
+
+        Args:
+            chord_progression: List of chord dictionaries
+
+        Returns:
+            uint16 array with one 12-bit pitch-class bitmap per chord.
+            Bit n is set when pitch class n sounds in the chord, so set
+            operations like overlap and transposition become single
+            integer bitwise ops instead of string comparisons.
+        """
+        return np.fromiter(
+            (_CHORD_TABLE.get(chord.get("chord"), _CHORD_TABLE['C'])[2]
+             for chord in chord_progression),
+            dtype=np.uint16, count=len(chord_progression)
+        )
+
+    def chord_similarity(self, chord_a: str, chord_b: str) -> float:
+        """
+        Measure how many pitch classes two chords share.
+
+        Args:
+            chord_a: First chord name
+            chord_b: Second chord name
+
+        Returns:
+            Jaccard similarity of the two pitch-class sets, computed
+            with bitwise ops on the packed bitmaps (1.0 for identical
+            pitch content, 0.0 for disjoint chords).
+        """
+        mask_a = self.parse_chord(chord_a)[2]
+        mask_b = self.parse_chord(chord_b)[2]
+
+        union = mask_a | mask_b
+        if union == 0:
+            return 0.0
+        return bin(mask_a & mask_b).count("1") / bin(union).count("1")
+
+    def analyze_chord_progression(self, chord_progression: List[Dict[str, Any]],
+                                  tempo: int = None,
+                                  key: str = None) -> Dict[str, Any]:
         """
         Comprehensive analysis of a chord progression.
-        
+
         Args:
             chord_progression: List of chord dictionaries
-            
+            tempo: Optional known tempo in BPM; when given, tempo
+                estimation is skipped
+            key: Optional known key; when given, key detection is
+                skipped
+
         Returns:
             Dictionary containing musical analysis
         """
-        # Calculate total duration safely
-        total_duration = 0.0
-        valid_chords = []
-        
-        for chord in chord_progression:
-            if "duration" in chord and isinstance(chord["duration"], (int, float)):
-                if chord["duration"] > 0:
-                    total_duration += chord["duration"]
-            if "chord" in chord and chord["chord"]:
-                valid_chords.append(chord["chord"])
-        
-        return {
-            "tempo": self.detect_tempo(chord_progression),
-            "key": self.detect_key(chord_progression),
+        # Overridden results must not be served to (or stored for)
+        # callers that asked for a full analysis, so the memo cache only
+        # participates when neither field is supplied
+        use_cache = tempo is None and key is None
+        if use_cache:
+            cached = self._cached_analysis(chord_progression)
+            if cached is not None:
+                return dict(cached)
+
+        # One fused pass collects everything the summary needs instead
+        # of separate traversals for tempo, key, duration and uniqueness
+        vote_ids, unique_chords, total_duration, duration_count = self._scan(
+            chord_progression)
+
+        if tempo is None:
+            if len(chord_progression) < 2 or duration_count == 0:
+                tempo = _DEFAULT_BPM  # Matching detect_tempo
+            else:
+                # Mean duration falls out of the scan's running sum/count
+                tempo = self._snap_bpm(
+                    _BEATS_PER_CHORD * 60.0 * duration_count / total_duration)
+
+        analysis = {
+            "tempo": tempo,
+            "key": key if key is not None else self._key_from_votes(vote_ids),
             "total_duration": total_duration,
             "chord_count": len(chord_progression),
-            "unique_chords": len(set(valid_chords)) if valid_chords else 0,
+            "unique_chords": unique_chords,
             "time_signature": "4/4",  # Default assumption
         }
+
+        if use_cache:
+            self._store_analysis(chord_progression, analysis)
+        return analysis
+
+    def analyze_many(self, progressions: List[List[Dict[str, Any]]]
+                     ) -> Dict[str, Any]:
+        """
+        Analyze a batch of chord progressions into column arrays.
+
+        Args:
+            progressions: List of chord progressions
+
+        Returns:
+            Dictionary of parallel columns — "tempos" (int16 array),
+            "keys" (list of str), "total_durations" (float64 array) and
+            "chord_counts" (int32 array) — with one entry per
+            progression. The columnar layout keeps a batch of N results
+            in a handful of contiguous allocations instead of N result
+            dicts, ready for DataFrame or tensor construction.
+        """
+        count = len(progressions)
+        tempos = np.empty(count, dtype=np.int16)
+        total_durations = np.empty(count, dtype=np.float64)
+        chord_counts = np.empty(count, dtype=np.int32)
+        keys = []
+
+        for i, progression in enumerate(progressions):
+            vote_ids, _, total_duration, duration_count = self._scan(
+                progression)
+
+            if len(progression) < 2 or duration_count == 0:
+                tempos[i] = _DEFAULT_BPM  # Matching detect_tempo
+            else:
+                tempos[i] = self._snap_bpm(
+                    _BEATS_PER_CHORD * 60.0 * duration_count / total_duration)
+
+            total_durations[i] = total_duration
+            chord_counts[i] = len(progression)
+            keys.append(self._key_from_votes(vote_ids))
+
+        return {
+            "tempos": tempos,
+            "keys": keys,
+            "total_durations": total_durations,
+            "chord_counts": chord_counts,
+        }
+
+    @staticmethod
+    def _progression_fingerprint(chord_progression: List[Dict[str, Any]]):
+        """
+        Build a hashable fingerprint of a progression's contents.
+
+        Returns None when the progression holds values that cannot be
+        fingerprinted, in which case caching is skipped. Note that the
+        cache assumes callers do not mutate chord dicts in place
+        between calls.
+        """
+        try:
+            fingerprint = tuple(
+                (chord.get("chord"), chord.get("start_time"),
+                 chord.get("duration"))
+                for chord in chord_progression
+            )
+            hash(fingerprint)
+        except (AttributeError, TypeError):
+            return None
+        return fingerprint
+
+    def _cached_analysis(self, chord_progression: List[Dict[str, Any]]):
+        """Return the memoized analysis for this progression, if any."""
+        fingerprint = self._progression_fingerprint(chord_progression)
+        if fingerprint is None:
+            return None
+
+        cached = self._analysis_cache.get(fingerprint)
+        if cached is not None:
+            self._analysis_cache.move_to_end(fingerprint)
+        return cached
+
+    def _store_analysis(self, chord_progression: List[Dict[str, Any]],
+                        analysis: Dict[str, Any]):
+        """Memoize an analysis result, evicting the oldest entry."""
+        fingerprint = self._progression_fingerprint(chord_progression)
+        if fingerprint is None:
+            return
+
+        self._analysis_cache[fingerprint] = dict(analysis)
+        if len(self._analysis_cache) > self._analysis_cache_size:
+            self._analysis_cache.popitem(last=False)
+
+    def _scan(self, chord_progression: List[Dict[str, Any]]
+              ) -> Tuple[np.ndarray, int, float, int]:
+        """
+        Fused single pass over a progression.
+
+        Args:
+            chord_progression: List of chord dictionaries
+
+        Returns:
+            Tuple of (key-vote row ids array, unique chord-name count,
+            total duration, valid duration count). Duration statistics
+            are accumulated as a running sum and count, so the pass
+            builds no intermediate duration list.
+        """
+        vote_ids = []
+        names = set()
+        total_duration = 0.0
+        duration_count = 0
+
+        for chord in chord_progression:
+            value = chord.get("duration")
+            if isinstance(value, (int, float)) and value > 0:
+                total_duration += value
+                duration_count += 1
+
+            name = chord.get("chord")
+            if name:
+                # Interned names share identity with the table keys
+                # (interned literals), so the set add and vote lookup
+                # below resolve on pointer equality. Non-string values
+                # still count and vote, just without interning
+                if isinstance(name, str):
+                    name = sys.intern(name)
+                names.add(name)
+                vote_ids.append(
+                    self._vote_ids.get(name, self._unknown_vote_id))
+
+        return (np.asarray(vote_ids, dtype=np.int64),
+                len(names), total_duration, duration_count)
     
-    def extract_features_for_ai(self, chord_progression: List[Dict[str, Any]]) -> np.ndarray:
+    def _chords_to_arrays(self, chord_progression: List[Dict[str, Any]]
+                          ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert a chord progression to structure-of-arrays form.
+
+        Args:
+            chord_progression: List of chord dictionaries
+
+        Returns:
+            Tuple of (chord_ids, start_times, durations) as contiguous
+            NumPy arrays. Missing or invalid fields become id 0, start
+            0.0 and duration 0.0, so downstream code can filter with a
+            simple mask instead of per-element type checks.
+        """
+        arrays = ChordProgressionArrays.from_dicts(chord_progression)
+        return arrays.chord_ids, arrays.start_times, arrays.durations
+
+    def extract_features_for_ai(self, chord_progression: List[Dict[str, Any]],
+                                analysis: Dict[str, Any] = None,
+                                out: np.ndarray = None) -> np.ndarray:
         """
         Extract numerical features from chord progression for AI model input.
-        
+
         Args:
             chord_progression: List of chord dictionaries
-            
+            analysis: Optional precomputed result of
+                analyze_chord_progression for the same progression;
+                when given, the tempo is read from it instead of
+                re-traversing the progression
+            out: Optional preallocated float32 array of length 10 that
+                the features are written into, so streaming callers can
+                reuse one buffer across calls instead of allocating a
+                fresh vector per frame
+
         Returns:
-            Feature vector as numpy array
+            Feature vector as numpy array (out when provided)
         """
-        # Simple feature extraction (can be expanded)
-        features = []
-        
-        # Basic features
-        features.append(len(chord_progression))  # Number of chords
-        features.append(self.detect_tempo(chord_progression))  # Tempo
-        
-        # Chord type encoding (simplified)
-        chord_types = {"C": 0, "Am": 1, "F": 2, "G": 3, "Dm": 4, "Em": 5}
-        chord_sequence = [chord_types.get(chord["chord"], 0) for chord in chord_progression]
-        
-        # Pad or truncate to fixed length
-        max_length = 8
-        if len(chord_sequence) < max_length:
-            chord_sequence.extend([0] * (max_length - len(chord_sequence)))
+        # Convert once to contiguous arrays so the encoding below runs
+        # as vectorized NumPy ops instead of per-chord Python loops
+        chord_ids, _, _ = self._chords_to_arrays(chord_progression)
+
+        if analysis is not None and "tempo" in analysis:
+            tempo = analysis["tempo"]
         else:
-            chord_sequence = chord_sequence[:max_length]
-        
-        features.extend(chord_sequence)
-        
-        return np.array(features, dtype=np.float32)
+            tempo = self.detect_tempo(chord_progression)
+
+        # Fixed-length layout: [chord count, tempo, 8 chord-type slots]
+        max_length = _FEATURE_LENGTH - 2
+        if out is None:
+            features = np.zeros(_FEATURE_LENGTH, dtype=np.float32)
+        else:
+            features = out
+            features[:] = 0.0
+
+        features[0] = len(chord_progression)  # Number of chords
+        features[1] = tempo  # Tempo
+
+        # Pad or truncate the chord sequence to the fixed length
+        sequence = chord_ids[:max_length]
+        features[2:2 + len(sequence)] = sequence
+
+        return features
+
+    def extract_features_streaming(self, chord_progression: List[Dict[str, Any]],
+                                   analysis: Dict[str, Any] = None) -> np.ndarray:
+        """
+        Allocation-free feature extraction for per-beat streaming use.
+
+        Args:
+            chord_progression: List of chord dictionaries
+            analysis: Optional precomputed analysis, as in
+                extract_features_for_ai
+
+        Returns:
+            View of the detector's internal scratch buffer. The buffer
+            is overwritten by the next streaming call, so callers that
+            need a stable vector should copy() it.
+        """
+        return self.extract_features_for_ai(
+            chord_progression, analysis=analysis, out=self._feature_scratch)
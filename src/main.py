@@ -9,11 +9,62 @@ bass and drum tracks from guitar input using AI models.
 import sys
 from pathlib import Path
 
-# Add src to Python path
-sys.path.append(str(Path(__file__).parent))
+try:
+    # Package import (python -m src.main, or from src import ...)
+    from .chord_detection import ChordDetector
+    from .midi_generator import MidiGenerator
+except ImportError:
+    # Script import (python src/main.py) — this directory is already
+    # the first sys.path entry, so no path mutation is needed
+    from chord_detection import ChordDetector
+    from midi_generator import MidiGenerator
 
-from chord_detection import ChordDetector
-from midi_generator import MidiGenerator
+
+# Example chord progression (simulated guitar input). A module-level
+# tuple, so repeat runs in one process share the same objects and the
+# detector's analysis cache can hit on the same fingerprint.
+SAMPLE_CHORDS = (
+    {"chord": "C", "start_time": 0.0, "duration": 2.0},
+    {"chord": "Am", "start_time": 2.0, "duration": 2.0},
+    {"chord": "F", "start_time": 4.0, "duration": 2.0},
+    {"chord": "G", "start_time": 6.0, "duration": 2.0},
+)
+
+
+def run_pipeline(chord_progression, out_dir,
+                 bass_name="bass_track.mid", drum_name="drum_track.mid",
+                 detector=None, generator=None):
+    """
+    Analyze one progression and write its bass and drum tracks.
+
+    The caller owns out_dir creation (one mkdir per batch, not one per
+    call) and can pass shared detector/generator instances so their
+    lookup tables are built once; per-call work is then just the
+    analysis, generation and two path joins.
+
+    Returns:
+        Tuple of (tempo, key, bass_path, drum_path)
+    """
+    if detector is None:
+        detector = ChordDetector()
+    if generator is None:
+        generator = MidiGenerator()
+
+    tempo = detector.detect_tempo(chord_progression)
+    key = detector.detect_key(chord_progression)
+
+    bass_midi, drum_midi = generator.generate_tracks(
+        chord_progression=chord_progression,
+        tempo=tempo,
+        key=key
+    )
+
+    bass_path = out_dir / bass_name
+    drum_path = out_dir / drum_name
+    generator.save_midi(bass_midi, str(bass_path))
+    generator.save_midi(drum_midi, str(drum_path))
+
+    return tempo, key, bass_path, drum_path
 
 
 def main():
@@ -23,61 +74,39 @@ def main():
     2. Generate bass and drum MIDI tracks
     3. Save output files
     """
-    print("AI Band Backend - Generating Music with AI")
-    print("=" * 50)
-    
+    # Progress chatter is collected and written in one buffered call at
+    # the end, so the run pays one stdout lock/flush instead of one per
+    # line
+    out = []
+    out.append("AI Band Backend - Generating Music with AI")
+    out.append("=" * 50)
+
     # Initialize components
     chord_detector = ChordDetector()
     midi_generator = MidiGenerator()
-    
-    # Example chord progression (simulated guitar input)
-    print("Analyzing chord progression...")
-    sample_chords = [
-        {"chord": "C", "start_time": 0.0, "duration": 2.0},
-        {"chord": "Am", "start_time": 2.0, "duration": 2.0},
-        {"chord": "F", "start_time": 4.0, "duration": 2.0},
-        {"chord": "G", "start_time": 6.0, "duration": 2.0},
-    ]
-    
-    # Detect tempo and key information
-    tempo = chord_detector.detect_tempo(sample_chords)
-    key = chord_detector.detect_key(sample_chords)
-    
-    print(f"Detected tempo: {tempo} BPM")
-    print(f"Detected key: {key}")
-    
-    # Generate bass track
-    print("Generating bass track...")
-    bass_midi = midi_generator.generate_bass_track(
-        chord_progression=sample_chords,
-        tempo=tempo,
-        key=key
-    )
-    
-    # Generate drum track
-    print("Generating drum track...")
-    drum_midi = midi_generator.generate_drum_track(
-        chord_progression=sample_chords,
-        tempo=tempo,
-        duration=8.0  # Total duration in seconds
-    )
-    
+
+    out.append("Analyzing chord progression...")
+    out.append("Generating bass and drum tracks...")
+    sample_chords = SAMPLE_CHORDS
+
     # Create output directory
     output_dir = Path("output")
     output_dir.mkdir(exist_ok=True)
-    
-    # Save MIDI files
-    bass_file = output_dir / "bass_track.mid"
-    drum_file = output_dir / "drum_track.mid"
-    
-    bass_midi.write(str(bass_file))
-    drum_midi.write(str(drum_file))
-    
-    print(f"Bass track saved: {bass_file}")
-    print(f"Drum track saved: {drum_file}")
-    print("\nAI Band Backend generation complete!")
-    print("Check the 'output' folder for your MIDI files")
-    print("Import these files into your DAW to hear the magic!")
+
+    tempo, key, bass_file, drum_file = run_pipeline(
+        sample_chords, output_dir,
+        detector=chord_detector, generator=midi_generator
+    )
+
+    out.append(f"Detected tempo: {tempo} BPM")
+    out.append(f"Detected key: {key}")
+    out.append(f"Bass track saved: {bass_file}")
+    out.append(f"Drum track saved: {drum_file}")
+    out.append("\nAI Band Backend generation complete!")
+    out.append("Check the 'output' folder for your MIDI files")
+    out.append("Import these files into your DAW to hear the magic!")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
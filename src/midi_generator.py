@@ -6,9 +6,103 @@ This module handles MIDI generation for bass and drum tracks using AI models.
 Integrates with Magenta and other AI frameworks for intelligent music generation.
 """
 
+import io
+import os
+import warnings
+
+import mido
+import numpy as np
 import pretty_midi
+from collections import OrderedDict
 from typing import List, Dict, Any
-import random
+
+# Shared RNG for the humanization pass: one Generator drawing batched
+# samples replaces per-note calls into the random module
+_RNG = np.random.default_rng()
+
+# GM program for the bass instrument, resolved once at import instead
+# of re-scanning pretty_midi's instrument-name table per track
+_BASS_PROGRAM = pretty_midi.instrument_name_to_program('Electric Bass (pick)')
+
+try:
+    # Optional fast MIDI serialization backend (C++). Falls back to
+    # pretty_midi's pure-Python writer when not installed.
+    import symusic
+except ImportError:
+    symusic = None
+
+# Set after the first failed symusic write so the fallback warning is
+# emitted once per process, not once per file
+_SYMUSIC_WARNED = False
+
+try:
+    # Optional JIT acceleration for the bass event kernel below, same
+    # arrangement as in chord_detection. Without numba the kernel runs
+    # as plain Python.
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def _bass_pattern_events(root: int, fifth: int, start_time: float,
+                         duration: float, beat_duration: float):
+    """
+    Compute the bass events for one chord as preallocated arrays.
+
+    Pure numeric kernel: picks the pattern for the chord duration
+    (quarter notes alternating root/fifth for long chords, half-note
+    roots for medium, one held root for short) and writes the clipped
+    note times into fixed-size buffers. Returns (starts, ends, pitches,
+    event count); only the first `count` slots are valid.
+    """
+    starts = np.empty(4, dtype=np.float64)
+    ends = np.empty(4, dtype=np.float64)
+    pitches = np.empty(4, dtype=np.int64)
+    n = 0
+
+    if duration >= 4.0:
+        # Root - Fifth - Root - Fifth (quarter notes)
+        for i in range(4):
+            offset = i * beat_duration
+            if offset < duration:
+                starts[n] = start_time + offset
+                ends[n] = start_time + offset + min(beat_duration,
+                                                    duration - offset)
+                pitches[n] = root if i % 2 == 0 else fifth
+                n += 1
+    elif duration >= 2.0:
+        # Root - Rest - Root - Rest (half notes)
+        for i in range(2):
+            offset = i * beat_duration * 2.0
+            if offset < duration:
+                starts[n] = start_time + offset
+                ends[n] = start_time + offset + min(beat_duration * 2.0,
+                                                    duration - offset)
+                pitches[n] = root
+                n += 1
+    elif duration > 0.0:
+        # One held root (whole note)
+        starts[0] = start_time
+        ends[0] = start_time + min(beat_duration * 4.0, duration)
+        pitches[0] = root
+        n = 1
+
+    return starts, ends, pitches, n
+
+
+if os.environ.get("AI_BAND_WARMUP"):
+    # Opt-in warm-up: exercising the kernel at import primes numba's
+    # on-disk cache, so a server process pays compile latency here
+    # rather than on its first real request. A no-op without numba.
+    _bass_pattern_events(36, 48, 0.0, 4.0, 0.5)
 
 
 class MidiGenerator:
@@ -21,7 +115,13 @@ class MidiGenerator:
     - Use AI models for intelligent music generation
     - Export high-quality MIDI files
     """
-    
+
+    __slots__ = (
+        "default_tempo", "ticks_per_beat", "chord_bass_notes",
+        "_chord_index", "_bass_table", "_rng", "_drum_pattern_cache",
+        "_drum_pattern_cache_size", "drum_map",
+    )
+
     def __init__(self):
         """Initialize the MIDI generator with default settings."""
         self.default_tempo = 120
@@ -37,6 +137,30 @@ class MidiGenerator:
             'Em': [28, 40],     # E1, E2
         }
         
+        # Integer-indexed view of the bass mapping: chord name -> row
+        # id, unknown chords falling back to row 0 (C). The per-chord
+        # lookup then hands the numeric kernel a table row instead of
+        # re-hashing strings and branching on membership.
+        self._chord_index = {
+            name: i for i, name in enumerate(self.chord_bass_notes)
+        }
+        self._bass_table = np.array(
+            list(self.chord_bass_notes.values()), dtype=np.int8
+        )
+
+        # Per-instance RNG handle, sharing the module Generator until
+        # seed() pins this instance to a reproducible stream
+        self._rng = _RNG
+
+        # Bounded memo of generated drum patterns keyed by (tempo,
+        # duration). The pattern only depends on those two values, so
+        # repeat calls rebuild Note objects from the cached events
+        # instead of re-running the synthesis loop. Capped like the
+        # detector's analysis cache so long-running processes seeing
+        # many distinct pairs don't grow it without limit.
+        self._drum_pattern_cache = OrderedDict()
+        self._drum_pattern_cache_size = 128
+
         # Standard drum kit MIDI note mappings
         self.drum_map = {
             'kick': 36,         # Bass Drum 1
@@ -62,77 +186,205 @@ class MidiGenerator:
         """
         # Create MIDI object
         midi = pretty_midi.PrettyMIDI(initial_tempo=tempo)
-        
+
+        bass, _ = self._build_bass_instrument(chord_progression, tempo)
+
+        midi.instruments.append(bass)
+        return midi
+
+    def _build_bass_instrument(self, chord_progression: List[Dict[str, Any]],
+                               tempo: int) -> tuple:
+        """
+        Walk the progression once, building the bass instrument.
+
+        Returns:
+            Tuple of (bass instrument, progression end time in seconds).
+            The end time falls out of the same pass, so callers that
+            also need the total duration (e.g. for a matching drum
+            track) avoid a second traversal.
+        """
         # Create bass instrument (Electric Bass)
-        bass_program = pretty_midi.instrument_name_to_program('Electric Bass (pick)')
-        bass = pretty_midi.Instrument(program=bass_program, is_drum=False, name='Bass')
-        
+        bass = pretty_midi.Instrument(program=_BASS_PROGRAM, is_drum=False,
+                                      name='Bass')
+
+        start_array, end_array, pitch_array, progression_end = \
+            self._bass_event_arrays(chord_progression, tempo)
+
+        note_cls = pretty_midi.Note  # Local alias for the tight loop
+        bass.notes = [
+            note_cls(velocity=80, pitch=pitch, start=start, end=end)
+            for pitch, start, end in zip(pitch_array.tolist(),
+                                         start_array.tolist(),
+                                         end_array.tolist())
+        ]
+
+        return bass, progression_end
+
+    def _bass_event_arrays(self, chord_progression: List[Dict[str, Any]],
+                           tempo: int) -> tuple:
+        """
+        Compute the bass events for a whole progression as SoA arrays.
+
+        Returns:
+            Tuple of (starts, ends, pitches, progression end time);
+            the first three are contiguous arrays with one entry per
+            generated note.
+        """
+        progression_end = 0.0
+
+        # Structure-of-arrays buffers for the generated notes; Note
+        # objects are materialized once at the end instead of being
+        # allocated inside the per-chord loop
+        starts: List[float] = []
+        ends: List[float] = []
+        pitches: List[int] = []
+
+        # One beat-length computation per track, not per chord
+        beat_duration = 60.0 / tempo
+
         # Generate bass notes for each chord
         for chord_info in chord_progression:
-            # Handle missing chord information gracefully
-            chord_name = chord_info.get("chord", "C")  # Default to C
+            # Handle missing chord information gracefully: empty,
+            # missing or unknown chords all resolve to table row 0 (C)
             start_time = chord_info.get("start_time", 0.0)
             duration = chord_info.get("duration", 2.0)
-            
-            # Skip empty or invalid chords
-            if not chord_name or not isinstance(chord_name, str):
-                chord_name = "C"
-            
-            # Get bass notes for this chord
-            if chord_name in self.chord_bass_notes:
-                bass_notes = self.chord_bass_notes[chord_name]
+
+            bass_notes = self._bass_table[
+                self._chord_index.get(chord_info.get("chord"), 0)]
+
+            # Generate bass pattern into the SoA buffers
+            self._append_bass_pattern(starts, ends, pitches, bass_notes,
+                                      start_time, duration, beat_duration)
+
+            if isinstance(start_time, (int, float)) and isinstance(duration, (int, float)):
+                progression_end = max(progression_end, start_time + duration)
+
+        # Contiguous per-field arrays, ready for vectorized post-passes
+        # or direct hand-off to an array-based serializer
+        return (np.asarray(starts, dtype=np.float64),
+                np.asarray(ends, dtype=np.float64),
+                np.asarray(pitches, dtype=np.int8),
+                progression_end)
+
+    def generate_bass_bytes(self, chord_progression: List[Dict[str, Any]],
+                            tempo: int = 120, key: str = "C") -> bytes:
+        """
+        Serialize a bass track straight to in-memory MIDI bytes.
+
+        Args:
+            chord_progression: List of chord dictionaries with timing
+            tempo: Tempo in BPM
+            key: Musical key
+
+        Returns:
+            Bytes of a standard MIDI file. The event arrays are
+            converted to ticks and written through mido into a BytesIO
+            buffer, skipping the PrettyMIDI object and the per-note
+            Python objects entirely — suited to serving paths that send
+            the file straight over the wire.
+        """
+        starts, ends, pitches, _ = self._bass_event_arrays(
+            chord_progression, tempo)
+
+        midi_file = mido.MidiFile(ticks_per_beat=self.ticks_per_beat)
+        track = mido.MidiTrack()
+        midi_file.tracks.append(track)
+        track.append(mido.MetaMessage(
+            'set_tempo', tempo=mido.bpm2tempo(tempo), time=0))
+        track.append(mido.Message(
+            'program_change', program=_BASS_PROGRAM, time=0))
+
+        ticks_per_second = self.ticks_per_beat * tempo / 60.0
+        start_ticks = np.rint(starts * ticks_per_second).astype(np.int64)
+        end_ticks = np.maximum(
+            np.rint(ends * ticks_per_second).astype(np.int64),
+            start_ticks + 1)
+
+        # Merge on/off events into one tick-ordered stream; the kind
+        # flag sorts note-offs before note-ons at the same tick
+        events = sorted(
+            [(tick, 1, pitch) for tick, pitch
+             in zip(start_ticks.tolist(), pitches.tolist())]
+            + [(tick, 0, pitch) for tick, pitch
+               in zip(end_ticks.tolist(), pitches.tolist())]
+        )
+
+        previous_tick = 0
+        for tick, kind, pitch in events:
+            delta = tick - previous_tick
+            previous_tick = tick
+            if kind:
+                track.append(mido.Message('note_on', note=pitch,
+                                          velocity=80, time=delta))
             else:
-                # Default to C if chord not found
-                bass_notes = self.chord_bass_notes['C']
-            
-            # Generate bass pattern
-            self._add_bass_pattern(bass, bass_notes, start_time, duration, tempo)
-        
-        midi.instruments.append(bass)
-        return midi
+                track.append(mido.Message('note_off', note=pitch,
+                                          velocity=0, time=delta))
+
+        buffer = io.BytesIO()
+        midi_file.save(file=buffer)
+        return buffer.getvalue()
+
+    def write_bass_to_file(self, output_path: str,
+                           chord_progression: List[Dict[str, Any]],
+                           tempo: int = 120):
+        """
+        Write a bass track to disk without materializing Note objects.
+
+        Args:
+            output_path: Destination file path
+            chord_progression: List of chord dictionaries with timing
+            tempo: Tempo in BPM
+
+        Long progressions go through the same array-to-ticks path as
+        generate_bass_bytes, so they never exist as a PrettyMIDI object
+        or a list of per-note Python objects in memory.
+        """
+        with open(output_path, "wb") as handle:
+            handle.write(self.generate_bass_bytes(chord_progression,
+                                                  tempo=tempo))
+
+    def generate_tracks(self, chord_progression: List[Dict[str, Any]],
+                        tempo: int = 120, key: str = "C",
+                        duration: float = None) -> tuple:
+        """
+        Generate bass and drum tracks with one pass over the progression.
+
+        Args:
+            chord_progression: List of chord dictionaries with timing
+            tempo: Tempo in BPM
+            key: Musical key
+            duration: Total drum duration in seconds; defaults to the
+                end of the progression, measured during the bass pass
+
+        Returns:
+            Tuple of (bass PrettyMIDI, drum PrettyMIDI)
+        """
+        bass_midi = pretty_midi.PrettyMIDI(initial_tempo=tempo)
+        bass, progression_end = self._build_bass_instrument(chord_progression, tempo)
+        bass_midi.instruments.append(bass)
+
+        if duration is None:
+            duration = progression_end
+
+        drum_midi = self.generate_drum_track(chord_progression, tempo=tempo,
+                                             duration=duration)
+
+        return bass_midi, drum_midi
     
-    def _add_bass_pattern(self, instrument: pretty_midi.Instrument, 
-                         bass_notes: List[int], start_time: float, 
-                         duration: float, tempo: int):
-        """Add a bass pattern for a chord duration."""
-        # Simple bass pattern: root note on beats 1 and 3
-        beat_duration = 60.0 / tempo  # Duration of one beat in seconds
-        
-        # Pattern: Root on beat 1, octave or fifth on beat 3
-        patterns = [
-            # Pattern 1: Root - Root - Root - Root (whole notes)
-            [(0, bass_notes[0], beat_duration * 4)],
-            
-            # Pattern 2: Root - Rest - Root - Rest (half notes)
-            [(0, bass_notes[0], beat_duration * 2),
-             (beat_duration * 2, bass_notes[0], beat_duration * 2)],
-            
-            # Pattern 3: Root - Fifth - Root - Fifth (quarter notes)
-            [(0, bass_notes[0], beat_duration),
-             (beat_duration, bass_notes[1], beat_duration),
-             (beat_duration * 2, bass_notes[0], beat_duration),
-             (beat_duration * 3, bass_notes[1], beat_duration)],
-        ]
-        
-        # Choose pattern based on duration
-        if duration >= 4.0:
-            pattern = patterns[2]  # More active for longer chords
-        elif duration >= 2.0:
-            pattern = patterns[1]  # Medium activity
-        else:
-            pattern = patterns[0]  # Simple for short chords
-        
-        # Add notes to instrument
-        for note_start, note_pitch, note_duration in pattern:
-            if note_start < duration:  # Make sure note fits in chord duration
-                actual_duration = min(note_duration, duration - note_start)
-                note = pretty_midi.Note(
-                    velocity=80,
-                    pitch=note_pitch,
-                    start=start_time + note_start,
-                    end=start_time + note_start + actual_duration
-                )
-                instrument.notes.append(note)
+    def _append_bass_pattern(self, starts: List[float], ends: List[float],
+                             pitches: List[int], bass_notes: List[int],
+                             start_time: float, duration: float,
+                             beat_duration: float):
+        """Append a bass pattern for a chord duration to the SoA buffers."""
+        # All the numeric work (pattern choice, clipping, note times)
+        # lives in the module kernel, which numba can compile
+        event_starts, event_ends, event_pitches, count = _bass_pattern_events(
+            bass_notes[0], bass_notes[1], start_time, duration, beat_duration)
+
+        for i in range(count):
+            starts.append(event_starts[i])
+            ends.append(event_ends[i])
+            pitches.append(int(event_pitches[i]))
     
     def generate_drum_track(self, chord_progression: List[Dict[str, Any]], 
                           tempo: int = 120, duration: float = 8.0) -> pretty_midi.PrettyMIDI:
@@ -149,64 +401,106 @@ class MidiGenerator:
         """
         # Create MIDI object
         midi = pretty_midi.PrettyMIDI(initial_tempo=tempo)
-        
-        # Create drum instrument
-        drums = pretty_midi.Instrument(program=0, is_drum=True, name='Drums')
-        
-        # Generate drum pattern
-        self._add_drum_pattern(drums, tempo, duration)
-        
-        midi.instruments.append(drums)
+        midi.instruments.append(self._build_drum_instrument(tempo, duration))
         return midi
+
+    def _build_drum_instrument(self, tempo: int,
+                               duration: float) -> pretty_midi.Instrument:
+        """Build the drum instrument, reusing cached pattern events."""
+        drums = pretty_midi.Instrument(program=0, is_drum=True, name='Drums')
+
+        # Generate drum pattern, reusing the cached events when this
+        # exact (tempo, duration) pair has been rendered before.
+        # Nearby durations can produce different measure counts, so the
+        # key must not round
+        cache_key = (tempo, duration)
+        events = self._drum_pattern_cache.get(cache_key)
+
+        if events is None:
+            self._add_drum_pattern(drums, tempo, duration)
+            self._drum_pattern_cache[cache_key] = tuple(
+                (note.velocity, note.pitch, note.start, note.end)
+                for note in drums.notes
+            )
+            if len(self._drum_pattern_cache) > self._drum_pattern_cache_size:
+                self._drum_pattern_cache.popitem(last=False)
+        else:
+            self._drum_pattern_cache.move_to_end(cache_key)
+            note_cls = pretty_midi.Note  # Local alias for the tight loop
+            drums.notes = [
+                note_cls(velocity=velocity, pitch=pitch,
+                         start=start, end=end)
+                for velocity, pitch, start, end in events
+            ]
+
+        return drums
     
-    def _add_drum_pattern(self, instrument: pretty_midi.Instrument, 
+    def _add_drum_pattern(self, instrument: pretty_midi.Instrument,
                          tempo: int, duration: float):
-        """Add a basic drum pattern."""
+        """
+        Add a basic drum pattern.
+
+        Basic 4/4 pattern: kick on beats 1 and 3, snare on 2 and 4,
+        closed hi-hat on every beat. The note times are computed as
+        measure offsets broadcast against per-voice beat offsets, so
+        the per-measure Python loop is replaced by a handful of array
+        ops regardless of how many measures fit.
+        """
         beat_duration = 60.0 / tempo  # Duration of one beat in seconds
-        current_time = 0.0
-        
-        while current_time < duration:
-            # Basic 4/4 pattern: Kick on 1,3 - Snare on 2,4 - Hi-hat on 1,2,3,4
-            measure_duration = beat_duration * 4
-            
-            if current_time + measure_duration > duration:
-                break
-            
-            # Kick drum on beats 1 and 3
-            kick_note1 = pretty_midi.Note(
-                velocity=100, pitch=self.drum_map['kick'],
-                start=current_time, end=current_time + 0.1
-            )
-            kick_note2 = pretty_midi.Note(
-                velocity=90, pitch=self.drum_map['kick'],
-                start=current_time + beat_duration * 2, 
-                end=current_time + beat_duration * 2 + 0.1
-            )
-            instrument.notes.extend([kick_note1, kick_note2])
-            
-            # Snare drum on beats 2 and 4
-            snare_note1 = pretty_midi.Note(
-                velocity=95, pitch=self.drum_map['snare'],
-                start=current_time + beat_duration, 
-                end=current_time + beat_duration + 0.1
-            )
-            snare_note2 = pretty_midi.Note(
-                velocity=95, pitch=self.drum_map['snare'],
-                start=current_time + beat_duration * 3, 
-                end=current_time + beat_duration * 3 + 0.1
-            )
-            instrument.notes.extend([snare_note1, snare_note2])
-            
-            # Hi-hat on every beat
-            for beat in range(4):
-                hihat_note = pretty_midi.Note(
-                    velocity=70, pitch=self.drum_map['hihat_closed'],
-                    start=current_time + beat * beat_duration,
-                    end=current_time + beat * beat_duration + 0.05
-                )
-                instrument.notes.append(hihat_note)
-            
-            current_time += measure_duration
+        measure_duration = beat_duration * 4
+
+        # Only whole measures fit, matching the old loop's early break
+        n_measures = int(duration // measure_duration)
+        if n_measures <= 0:
+            return
+
+        measure_starts = np.arange(n_measures) * measure_duration
+
+        kick_starts = (measure_starts[:, None]
+                       + np.array([0.0, beat_duration * 2])).ravel()
+        snare_starts = (measure_starts[:, None]
+                        + np.array([beat_duration, beat_duration * 3])).ravel()
+        hihat_starts = (measure_starts[:, None]
+                        + np.arange(4) * beat_duration).ravel()
+
+        starts = np.concatenate([kick_starts, snare_starts, hihat_starts])
+        ends = np.concatenate([
+            kick_starts + 0.1, snare_starts + 0.1, hihat_starts + 0.05
+        ])
+        # MIDI pitches and velocities fit in a byte, so the buffers are
+        # kept at byte width instead of default int64
+        pitches = np.concatenate([
+            np.full(kick_starts.size, self.drum_map['kick'], dtype=np.uint8),
+            np.full(snare_starts.size, self.drum_map['snare'],
+                    dtype=np.uint8),
+            np.full(hihat_starts.size, self.drum_map['hihat_closed'],
+                    dtype=np.uint8),
+        ])
+        velocities = np.concatenate([
+            # Beat 1 kick hits harder than beat 3
+            np.tile(np.array([100, 90], dtype=np.uint8), n_measures),
+            np.full(snare_starts.size, 95, dtype=np.uint8),
+            np.full(hihat_starts.size, 70, dtype=np.uint8),
+        ])
+
+        # One stable sort puts the voice-grouped events back in
+        # chronological order, so serializers that expect (or sort
+        # into) time order get already-sorted input
+        order = np.argsort(starts, kind='stable')
+        starts = starts[order]
+        ends = ends[order]
+        pitches = pitches[order]
+        velocities = velocities[order]
+
+        # A list comprehension knows its length up front, so the target
+        # list is built in one allocation rather than grown note by note
+        note_cls = pretty_midi.Note  # Local alias for the tight loop
+        instrument.notes.extend([
+            note_cls(velocity=velocity, pitch=pitch, start=start, end=end)
+            for velocity, pitch, start, end in zip(
+                velocities.tolist(), pitches.tolist(),
+                starts.tolist(), ends.tolist())
+        ])
     
     def generate_ai_bass_track(self, chord_progression: List[Dict[str, Any]], 
                               tempo: int = 120) -> pretty_midi.PrettyMIDI:
@@ -226,43 +520,190 @@ class MidiGenerator:
         """
         # TODO: Integrate with Magenta's MusicVAE or other AI models
         # For now, use enhanced rule-based generation
-        
-        midi = self.generate_bass_track(chord_progression, tempo)
-        
-        # Add some AI-like variations
-        bass_instrument = midi.instruments[0]
-        self._add_bass_variations(bass_instrument)
-        
+
+        # Apply the variations directly to the event arrays, so the
+        # notes are materialized once, already humanized, instead of
+        # built clean and then mutated one by one
+        starts, ends, pitches, _ = self._bass_event_arrays(
+            chord_progression, tempo)
+        start_deltas, end_deltas, velocity_deltas = \
+            self._variation_deltas(starts.size)
+
+        starts = starts + start_deltas
+        ends = ends + end_deltas
+        velocities = np.clip(80 + velocity_deltas, 30, 127)
+
+        bass = pretty_midi.Instrument(program=_BASS_PROGRAM, is_drum=False,
+                                      name='Bass')
+        note_cls = pretty_midi.Note  # Local alias for the tight loop
+        bass.notes = [
+            note_cls(velocity=velocity, pitch=pitch, start=start, end=end)
+            for velocity, pitch, start, end in zip(
+                velocities.tolist(), pitches.tolist(),
+                starts.tolist(), ends.tolist())
+        ]
+
+        midi = pretty_midi.PrettyMIDI(initial_tempo=tempo)
+        midi.instruments.append(bass)
         return midi
     
+    def _variation_deltas(self, n: int) -> tuple:
+        """
+        Draw batched humanization deltas for n notes.
+
+        Returns:
+            Tuple of (start_deltas, end_deltas, velocity_deltas)
+            arrays: ~30% of slots get timing offsets of up to ±0.05s,
+            ~40% get a velocity change of up to ±20; the rest are zero.
+            Everything comes from a few batched RNG calls instead of
+            per-note draws.
+        """
+        rng = self._rng
+        time_mask = rng.random(n) < 0.3
+        start_deltas = rng.uniform(-0.05, 0.05, n) * time_mask
+        end_deltas = rng.uniform(-0.05, 0.05, n) * time_mask
+        velocity_deltas = rng.integers(-20, 21, n) * (rng.random(n) < 0.4)
+        return start_deltas, end_deltas, velocity_deltas
+
     def _add_bass_variations(self, instrument: pretty_midi.Instrument):
         """Add variations to make bass line more interesting."""
-        # Add some passing notes and rhythmic variations
-        for i, note in enumerate(instrument.notes):
-            # Occasionally add slight timing variations
-            if random.random() < 0.3:
-                note.start += random.uniform(-0.05, 0.05)
-                note.end += random.uniform(-0.05, 0.05)
-            
-            # Occasionally change velocity for dynamics
-            if random.random() < 0.4:
-                note.velocity += random.randint(-20, 20)
-                note.velocity = max(30, min(127, note.velocity))
+        notes = instrument.notes
+        n = len(notes)
+        if n == 0:
+            return
+
+        start_deltas, end_deltas, velocity_deltas = self._variation_deltas(n)
+
+        for note, start_delta, end_delta, velocity_delta in zip(
+                notes, start_deltas.tolist(), end_deltas.tolist(),
+                velocity_deltas.tolist()):
+            note.start += start_delta
+            note.end += end_delta
+            if velocity_delta:
+                note.velocity = max(30, min(127,
+                                            note.velocity + velocity_delta))
     
-    def combine_tracks(self, bass_midi: pretty_midi.PrettyMIDI, 
-                      drum_midi: pretty_midi.PrettyMIDI) -> pretty_midi.PrettyMIDI:
+    def seed(self, seed: int):
+        """
+        Seed this generator's RNG for reproducible variations.
+
+        Args:
+            seed: Seed for a fresh PCG64 stream; subsequent
+                generate_ai_bass_track calls on this instance produce
+                identical variations for identical input
+        """
+        self._rng = np.random.default_rng(seed)
+
+    def save_midi(self, midi: pretty_midi.PrettyMIDI, output_path: str):
+        """
+        Save a generated MIDI object to disk.
+
+        Args:
+            midi: PrettyMIDI object to serialize
+            output_path: Destination file path
+
+        Note:
+            When the optional symusic backend is installed, serialization
+            goes through its C++ writer, which is orders of magnitude
+            faster than pretty_midi's Python event encoding on large
+            progressions. Otherwise pretty_midi's own writer is used.
+        """
+        if symusic is not None:
+            try:
+                self._write_with_symusic(midi, str(output_path))
+                return
+            except (AttributeError, TypeError, ValueError) as exc:
+                # Mismatch with the installed symusic API: warn once so
+                # the silent downgrade to the slow writer is visible,
+                # then fall through to pretty_midi below
+                global _SYMUSIC_WARNED
+                if not _SYMUSIC_WARNED:
+                    _SYMUSIC_WARNED = True
+                    warnings.warn(
+                        f"symusic MIDI write failed ({exc!r}); falling "
+                        "back to pretty_midi's writer",
+                        RuntimeWarning)
+
+        midi.write(str(output_path))
+
+    def _write_with_symusic(self, midi: pretty_midi.PrettyMIDI, output_path: str):
+        """Serialize a PrettyMIDI object through symusic's C++ writer."""
+        tempo = midi.get_tempo_changes()[1][0]
+        ticks_per_second = self.ticks_per_beat * tempo / 60.0
+
+        score = symusic.Score(self.ticks_per_beat)
+        score.tempos.append(symusic.Tempo(0, tempo))
+
+        for instrument in midi.instruments:
+            track = symusic.Track(
+                name=instrument.name,
+                program=instrument.program,
+                is_drum=instrument.is_drum
+            )
+            for note in instrument.notes:
+                start_tick = round(note.start * ticks_per_second)
+                duration_ticks = max(
+                    1, round((note.end - note.start) * ticks_per_second)
+                )
+                track.notes.append(
+                    symusic.Note(start_tick, duration_ticks,
+                                 note.pitch, note.velocity)
+                )
+            score.tracks.append(track)
+
+        score.dump_midi(output_path)
+
+    def generate_combined(self, chord_progression: List[Dict[str, Any]],
+                          tempo: int = 120, key: str = "C",
+                          duration: float = None) -> pretty_midi.PrettyMIDI:
+        """
+        Generate bass and drums directly into one PrettyMIDI object.
+
+        Args:
+            chord_progression: List of chord dictionaries with timing
+            tempo: Tempo in BPM
+            key: Musical key
+            duration: Total drum duration in seconds; defaults to the
+                end of the progression
+
+        Returns:
+            Combined PrettyMIDI with both instruments. Skips the
+            build-two-then-merge round trip of generate_tracks +
+            combine_tracks.
+        """
+        combined = pretty_midi.PrettyMIDI(initial_tempo=tempo)
+
+        bass, progression_end = self._build_bass_instrument(
+            chord_progression, tempo)
+        if duration is None:
+            duration = progression_end
+
+        combined.instruments.append(bass)
+        combined.instruments.append(
+            self._build_drum_instrument(tempo, duration))
+        return combined
+
+    def combine_tracks(self, bass_midi: pretty_midi.PrettyMIDI,
+                      drum_midi: pretty_midi.PrettyMIDI,
+                      tempo: int = None) -> pretty_midi.PrettyMIDI:
         """
         Combine bass and drum tracks into a single MIDI file.
-        
+
         Args:
             bass_midi: Bass track MIDI
             drum_midi: Drum track MIDI
-            
+            tempo: Tempo in BPM for the combined file; when omitted it
+                is recovered from the bass track's tempo events, which
+                costs a scan of that MIDI
+
         Returns:
             Combined MIDI file
         """
+        if tempo is None:
+            tempo = bass_midi.get_tempo_changes()[1][0]
+
         # Create new MIDI object
-        combined = pretty_midi.PrettyMIDI(initial_tempo=bass_midi.get_tempo_changes()[1][0])
+        combined = pretty_midi.PrettyMIDI(initial_tempo=tempo)
         
         # Add bass instrument
         if bass_midi.instruments: